@@ -2,12 +2,12 @@ import React, { useEffect, useState, useMemo } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { activityLogApi } from '../utils/apiClient';
 import { ActivityLog } from '../utils/types';
+import { formatTimeOfDay } from '../utils/badgeHelpers';
+import { getActionIcon, groupLogsByDay } from '../utils/activityHelpers';
+import { getInitials } from '../lib/utils';
+import { sortByKey } from '../lib/utils/transformers';
 import { 
   X, 
-  Ticket, 
-  UserPlus, 
-  RefreshCw, 
-  MessageSquare, 
   Clock 
 } from 'lucide-react';
 import { LoadingState } from './LoadingState';
@@ -18,8 +18,39 @@ interface BugActivityLogProps {
   onClose: () => void;
 }
 
-interface GroupedLogs {
-  [key: string]: ActivityLog[];
+/**
+ * Describes an activity for the timeline row
+ * Defined at module scope so it is not re-created on every render
+ */
+function getActionText(log: ActivityLog): JSX.Element {
+  switch (log.action) {
+    case 'reported':
+      return <span className="text-sm text-gray-600 dark:text-gray-400">created this ticket</span>;
+    case 'assigned':
+      return (
+        <span className="text-sm text-gray-600 dark:text-gray-400">
+          assigned to <span className="font-semibold text-gray-900 dark:text-gray-100">{log.assignedToName || 'a user'}</span>
+        </span>
+      );
+    case 'status_changed':
+      return (
+        <span className="text-sm text-gray-600 dark:text-gray-400">
+          changed status to <StatusBadge status={log.newStatus || ''} />
+        </span>
+      );
+    case 'validated':
+      return <span className="text-sm text-gray-600 dark:text-gray-400">validated this ticket</span>;
+    default:
+      return <span className="text-sm text-gray-600 dark:text-gray-400">performed an action</span>;
+  }
+}
+
+/**
+ * Formats an activity time as a time of day
+ */
+function formatTimestamp(timestamp: string | Date): string {
+  const date = typeof timestamp === 'string' ? new Date(timestamp) : timestamp;
+  return formatTimeOfDay(date);
 }
 
 export const BugActivityLog: React.FC<BugActivityLogProps> = ({ bugId, isOpen, onClose }) => {
@@ -48,100 +79,12 @@ export const BugActivityLog: React.FC<BugActivityLogProps> = ({ bugId, isOpen, o
     }
   }, [isOpen, bugId]);
 
-  // Group logs by date
-  const groupedLogs = useMemo(() => {
-    // Sort logs by timestamp descending first to ensure correct order within groups
-    const sortedLogs = [...activityLogs].sort((a, b) => {
-      const dateA = a.timestamp instanceof Date ? a.timestamp : new Date(a.timestamp);
-      const dateB = b.timestamp instanceof Date ? b.timestamp : new Date(b.timestamp);
-      return dateB.getTime() - dateA.getTime();
-    });
-
-    const groups: GroupedLogs = {};
-    const now = new Date();
-    const today = new Date(now.getFullYear(), now.getMonth(), now.getDate());
-    const yesterday = new Date(today);
-    yesterday.setDate(yesterday.getDate() - 1);
-    
-    sortedLogs.forEach((log) => {
-      const logDate = log.timestamp instanceof Date ? log.timestamp : new Date(log.timestamp);
-      const logDay = new Date(logDate.getFullYear(), logDate.getMonth(), logDate.getDate());
-      
-      let groupKey: string;
-      if (logDay.getTime() === today.getTime()) {
-        groupKey = 'Today';
-      } else if (logDay.getTime() === yesterday.getTime()) {
-        groupKey = 'Yesterday';
-      } else if (now.getTime() - logDate.getTime() < 7 * 24 * 60 * 60 * 1000) {
-        groupKey = logDate.toLocaleDateString('en-US', { weekday: 'long' });
-      } else {
-        groupKey = logDate.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
-      }
-      
-      if (!groups[groupKey]) {
-        groups[groupKey] = [];
-      }
-      groups[groupKey].push(log);
-    });
-    
-    return groups;
-  }, [activityLogs]);
-
-  const getActionIcon = (action: string) => {
-    switch (action) {
-      case 'reported':
-        return <Ticket className="w-4 h-4" />;
-      case 'assigned':
-        return <UserPlus className="w-4 h-4" />;
-      case 'status_changed':
-        return <RefreshCw className="w-4 h-4" />;
-      case 'validated':
-        return <MessageSquare className="w-4 h-4" />;
-      default:
-        return <Ticket className="w-4 h-4" />;
-    }
-  };
-
-  const getActionText = (log: ActivityLog): JSX.Element => {
-    switch (log.action) {
-      case 'reported':
-        return <span className="text-sm text-gray-600 dark:text-gray-400">created this ticket</span>;
-      case 'assigned':
-        return (
-          <span className="text-sm text-gray-600 dark:text-gray-400">
-            assigned to <span className="font-semibold text-gray-900 dark:text-gray-100">{log.assignedToName || 'a user'}</span>
-          </span>
-        );
-      case 'status_changed':
-        return (
-          <span className="text-sm text-gray-600 dark:text-gray-400">
-            changed status to <StatusBadge status={log.newStatus || ''} />
-          </span>
-        );
-      case 'validated':
-        return <span className="text-sm text-gray-600 dark:text-gray-400">validated this ticket</span>;
-      default:
-        return <span className="text-sm text-gray-600 dark:text-gray-400">performed an action</span>;
-    }
-  };
-
-  const formatTimestamp = (timestamp: string | Date): string => {
-    const date = typeof timestamp === 'string' ? new Date(timestamp) : timestamp;
-    return date.toLocaleTimeString('en-US', {
-      hour: 'numeric',
-      minute: '2-digit',
-      hour12: true
-    });
-  };
-
-  const getInitials = (name: string): string => {
-    return name
-      .split(' ')
-      .map(n => n[0])
-      .join('')
-      .toUpperCase()
-      .slice(0, 2);
-  };
+  // Group logs by date, newest first within each group
+  const groupedLogs = useMemo(() => groupLogsByDay(sortByKey(
+    activityLogs,
+    log => (log.timestamp instanceof Date ? log.timestamp : new Date(log.timestamp)).getTime(),
+    true
+  )), [activityLogs]);
 
   return (
     <AnimatePresence>
@@ -56,11 +56,6 @@ export const CommentSection: React.FC<CommentSectionProps> = ({
     }
   };
 
-  // Sort comments chronologically (oldest first)
-  const sortedComments = [...comments].sort(
-    (a, b) => new Date(a.createdAt).getTime() - new Date(b.createdAt).getTime()
-  );
-
   return (
     <Card>
       <CardHeader>
@@ -70,10 +65,10 @@ export const CommentSection: React.FC<CommentSectionProps> = ({
       </CardHeader>
 
       <CardContent className="space-y-4">
-        {/* Comment thread */}
-        {sortedComments.length > 0 ? (
+        {/* Comment thread (already oldest first from CommentRepository.getByBug) */}
+        {comments.length > 0 ? (
           <div className="space-y-4">
-            {sortedComments.map((comment) => {
+            {comments.map((comment) => {
               const authorName = getUserName(comment.authorId);
               const isCurrentUser = comment.authorId === currentUserId;
 
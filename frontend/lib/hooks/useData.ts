@@ -132,34 +132,21 @@ export function useAllSprints() {
 }
 
 /**
- * Hook to fetch all activity logs without caching
+ * Hook to fetch all activity logs with caching
+ * Revisiting the page renders the cached logs immediately while they revalidate,
+ * instead of blocking on a full refetch and enrichment of every log
  */
 export function useActivityLogs() {
-  const [activityLogs, setActivityLogs] = useState<ActivityLog[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
-  const [error, setError] = useState<unknown>(null);
-
-  const fetchLogs = useCallback(async () => {
-    setIsLoading(true);
-    try {
-      const data = await activityLogApi.getAll();
-      setActivityLogs(data);
-      setError(null);
-    } catch (err) {
-      setError(err);
-    } finally {
-      setIsLoading(false);
-    }
-  }, []);
-
-  useEffect(() => {
-    fetchLogs();
-  }, [fetchLogs]);
+  const { data, error, isLoading, isValidating, mutate } = useSWR<ActivityLog[]>('/api/activity-logs', () => activityLogApi.getAll(), {
+    revalidateOnFocus: false,
+    dedupingInterval: 30000, // 30 seconds
+  });
 
   return {
-    activityLogs,
+    activityLogs: data || [],
     isLoading,
+    isValidating,
     isError: error,
-    mutate: fetchLogs
+    mutate
   };
 }
@@ -14,13 +14,25 @@
 
 import { CollectionDBService } from '../services/collectionDb';
 import { Activity, CreateActivityInput, ActivityAction } from '../models/activity';
+import { BugStatus } from '../models/bug';
 import { logger } from '../utils/logger';
+import { createStringPool, extractSingle, internString, parseDate, sortByKey } from '../utils/transformers';
 import { CacheService } from '../services/cacheService';
 
 const COLLECTION_PLURAL = 'bug_tracking_activitiess';
 const COLLECTION_SINGULAR = 'bug_tracking_activities';
 // const CACHE_TTL = 60 * 1000; // 1 minute cache for activities
 
+/** Short TTL for per-bug activity lists, which other users also write to */
+const BUG_ACTIVITIES_CACHE_TTL = 30 * 1000; // 30 seconds
+
+/**
+ * Canonical instances of low-cardinality activity fields
+ * Decoded rows share these instead of allocating a string per row
+ */
+const ACTION_POOL = createStringPool(Object.values(ActivityAction));
+const STATUS_POOL = createStringPool<string>(Object.values(BugStatus));
+
 /**
  * Transforms activity data for Collection DB storage
  * Ensures relational fields are stored as arrays
@@ -48,53 +60,18 @@ function transformActivityForStorage(activity: Partial<Activity>): Record<string
 /**
  * Transforms activity data from Collection DB
  * Extracts relational fields from arrays to single values
- * Handles both camelCase and snake_case keys for robustness
  */
 function transformActivityFromStorage(activity: Record<string, unknown>): Activity {
-  // Helper to extract single value from array or value
-  const extractSingle = (val: unknown) => {
-    if (Array.isArray(val)) {
-      return val.length > 0 ? val[0] : undefined;
-    }
-    // Handle stringified array case
-    if (typeof val === 'string' && val.startsWith('[') && val.endsWith(']')) {
-      try {
-        const parsed = JSON.parse(val.replace(/'/g, '"'));
-        if (Array.isArray(parsed)) {
-          return parsed.length > 0 ? parsed[0] : undefined;
-        }
-      } catch {
-        // Ignore
-      }
-    }
-    return val;
-  };
-
-  // Helper to parse date from string, number, or Date
-  const parseDate = (val: unknown): Date => {
-    if (!val) return new Date();
-    if (val instanceof Date) return val;
-    if (typeof val === 'string' || typeof val === 'number') {
-      const d = new Date(val);
-      return isNaN(d.getTime()) ? new Date() : d;
-    }
-    return new Date();
-  };
-
-  const id = (activity.id || activity._id || activity.__auto_id__) as string;
-  const action = (activity.action || 'reported') as ActivityAction; // Default to reported if missing
-  
-  const bugIdRaw = activity.bugId || activity.bug_id;
-  const authorIdRaw = activity.authorId || activity.author_id;
-  const assignedToIdRaw = activity.assignedToId || activity.assigned_to_id;
+  const id = activity.id as string;
+  const action = internString(ACTION_POOL, activity.action, ActivityAction.REPORTED); // Default to reported if missing
   
-  const bugId = extractSingle(bugIdRaw) as string;
-  const authorId = extractSingle(authorIdRaw) as string;
-  const assignedToId = extractSingle(assignedToIdRaw) as string | undefined;
+  const bugId = extractSingle(activity.bugId) as string;
+  const authorId = extractSingle(activity.authorId) as string;
+  const assignedToId = extractSingle(activity.assignedToId) as string | undefined;
   
-  const newStatus = (activity.newStatus || activity.new_status) as string | undefined;
+  const newStatus = activity.newStatus ? internString(STATUS_POOL, activity.newStatus, '') : undefined;
   
-  const timestampRaw = activity.timestamp || activity.created_at || activity.created;
+  const timestampRaw = activity.timestamp || activity.createdAt || activity.created;
   const timestamp = parseDate(timestampRaw);
 
   return {
@@ -108,6 +85,53 @@ function transformActivityFromStorage(activity: Record<string, unknown>): Activi
   };
 }
 
+/**
+ * Selects the newest activities, newest first
+ * Keeps a bounded min-heap of size `limit`, so picking the top K of N
+ * activities costs O(N log K) instead of sorting all N
+ * @param activities - Activities in any order
+ * @param limit - Maximum number of activities to return
+ * @returns Up to `limit` newest activities, sorted by timestamp descending
+ */
+function selectNewest(activities: Activity[], limit: number): Activity[] {
+  const heap: Activity[] = [];
+  const keyOf = (activity: Activity) => activity.timestamp.getTime();
+
+  const siftUp = (index: number) => {
+    while (index > 0) {
+      const parent = (index - 1) >> 1;
+      if (keyOf(heap[parent]) <= keyOf(heap[index])) return;
+      [heap[parent], heap[index]] = [heap[index], heap[parent]];
+      index = parent;
+    }
+  };
+
+  const siftDown = (index: number) => {
+    for (;;) {
+      const left = 2 * index + 1;
+      const right = left + 1;
+      let smallest = index;
+      if (left < heap.length && keyOf(heap[left]) < keyOf(heap[smallest])) smallest = left;
+      if (right < heap.length && keyOf(heap[right]) < keyOf(heap[smallest])) smallest = right;
+      if (smallest === index) return;
+      [heap[smallest], heap[index]] = [heap[index], heap[smallest]];
+      index = smallest;
+    }
+  };
+
+  for (const activity of activities) {
+    if (heap.length < limit) {
+      heap.push(activity);
+      siftUp(heap.length - 1);
+    } else if (limit > 0 && keyOf(activity) > keyOf(heap[0])) {
+      heap[0] = activity;
+      siftDown(0);
+    }
+  }
+
+  return heap.sort((a, b) => keyOf(b) - keyOf(a));
+}
+
 export class ActivityRepository {
   constructor(
     private readonly collectionDb: CollectionDBService,
@@ -136,7 +160,21 @@ export class ActivityRepository {
       storageData
     );
 
-    const activity = transformActivityFromStorage(createdActivity);
+    // Everything but the ID is already known from what we wrote,
+    // so build the activity directly instead of decoding the echoed item
+    const activity: Activity = {
+      ...activityToCreate,
+      id: createdActivity.id as string,
+    };
+
+    // Update cache for bug activities (Write-Through)
+    // Cached lists are newest first, so the new activity goes to the front
+    const cacheKey = `activities:bug:${activity.bugId}`;
+    const cachedActivities = this.cacheService.get<Activity[]>(cacheKey);
+    if (cachedActivities) {
+      this.cacheService.set(cacheKey, [activity, ...cachedActivities], BUG_ACTIVITIES_CACHE_TTL);
+      logger.debug('Updated activities cache for bug', { bugId: activity.bugId });
+    }
 
     logger.info('Activity created successfully', { 
       id: activity.id, 
@@ -149,11 +187,16 @@ export class ActivityRepository {
   /**
    * Fetches all activities from the collection.
    *
+   * @param {number} [limit] - When set, only the newest `limit` activities are returned, newest first.
    * @returns {Promise<Activity[]>} Promise resolving to an array of Activity objects.
    * @throws {Error} If the database service fails to fetch activities.
    */
-  async getAll(): Promise<Activity[]> {
-    logger.debug('Fetching all activities');
+  async getAll(limit?: number): Promise<Activity[]> {
+    logger.debug('Fetching all activities', { limit });
+
+    if (limit !== undefined) {
+      return this.getRecent(limit);
+    }
 
     const activities = await this.collectionDb.getAllItems<Record<string, unknown>>(COLLECTION_PLURAL, {
       includeDetail: false,
@@ -183,7 +226,7 @@ export class ActivityRepository {
 
     if (activity) {
       const transformed = transformActivityFromStorage(activity);
-      logger.info('Activity fetched successfully', { activityId });
+      logger.debug('Activity fetched successfully', { activityId });
       return transformed;
     } else {
       logger.debug('Activity not found', { activityId });
@@ -195,10 +238,18 @@ export class ActivityRepository {
    * Fetches all activities associated with a specific bug.
    *
    * @param {string} bugId - The unique identifier of the bug to filter activities by.
+   * @param {number} [limit] - When set, only the newest `limit` activities are returned.
    * @returns {Promise<Activity[]>} A promise that resolves to an array of activities related to the specified bug.
    * @throws {Error} If the underlying database query fails.
    */
-  async getByBug(bugId: string): Promise<Activity[]> {
+  async getByBug(bugId: string, limit?: number): Promise<Activity[]> {
+    // Check cache first
+    const cacheKey = `activities:bug:${bugId}`;
+    const cachedActivities = this.cacheService.get<Activity[]>(cacheKey);
+    if (cachedActivities) {
+      return limit !== undefined ? cachedActivities.slice(0, limit) : cachedActivities;
+    }
+
     logger.debug('Fetching activities by bug', { bugId });
 
     const activities = await this.collectionDb.queryItems<Record<string, unknown>>(
@@ -216,37 +267,46 @@ export class ActivityRepository {
       }
     );
 
-    const transformedActivities = activities.map(transformActivityFromStorage);
-    
     // Sort by timestamp descending
-    transformedActivities.sort((a, b) => b.timestamp.getTime() - a.timestamp.getTime());
+    const transformedActivities = sortByKey(
+      activities.map(transformActivityFromStorage),
+      activity => activity.timestamp.getTime(),
+      true
+    );
+
+    // Cache the result
+    this.cacheService.set(cacheKey, transformedActivities, BUG_ACTIVITIES_CACHE_TTL);
     
     logger.info('Activities fetched by bug successfully', { bugId, count: transformedActivities.length });
-    return transformedActivities;
+    return limit !== undefined ? transformedActivities.slice(0, limit) : transformedActivities;
   }
 
   /**
    * Fetches the most recent activities up to the specified limit.
    *
-   * @param {number} limit - The maximum number of recent activities to retrieve (max 1000).
+   * @param {number} limit - The maximum number of recent activities to retrieve.
    * @returns {Promise<Activity[]>} A promise that resolves to an array of recent activities.
    * @throws {Error} If the underlying database query fails.
    */
   async getRecent(limit: number): Promise<Activity[]> {
     logger.debug('Fetching recent activities', { limit });
 
-    const activities = await this.collectionDb.getAllItems<Record<string, unknown>>(COLLECTION_PLURAL, {
-      includeDetail: false,
-      pageSize: Math.min(limit, 1000),
-    });
-
-    const transformedActivities = activities.map(transformActivityFromStorage);
-    
-    // Sort by timestamp descending if not already sorted by DB
-    transformedActivities.sort((a, b) => b.timestamp.getTime() - a.timestamp.getTime());
-    
-    // Slice to limit
-    const limitedActivities = transformedActivities.slice(0, limit);
+    // Stream the collection page by page, keeping only the running newest `limit`,
+    // so peak memory is one page plus the result instead of the whole collection
+    let limitedActivities: Activity[] = [];
+    await this.collectionDb.scanItems<Record<string, unknown>>(
+      COLLECTION_PLURAL,
+      (items) => {
+        limitedActivities = selectNewest(
+          limitedActivities.concat(items.map(transformActivityFromStorage)),
+          limit
+        );
+      },
+      {
+        includeDetail: false,
+        pageSize: 1000,
+      }
+    );
     
     logger.info('Recent activities fetched successfully', { count: limitedActivities.length, limit });
     return limitedActivities;
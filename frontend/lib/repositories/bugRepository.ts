@@ -13,17 +13,40 @@
  * Requirements: 5.1, 5.2, 5.3, 5.4, 5.6, 5.7
  */
 
+import { LRUCache } from 'lru-cache';
 import { CollectionDBService, FilterQuery } from '../services/collectionDb';
 import { CacheService } from '../services/cacheService';
 import { Bug, CreateBugInput, UpdateBugInput, BugStatus, BugTag, BugPriority, BugSeverity, BugType } from '../models/bug';
 import { Project } from '../models/project';
 import { User } from '../models/user';
 import { logger } from '../utils/logger';
+import { createStringPool, extractSingle, internString, parseDate } from '../utils/transformers';
 
 const COLLECTION_PLURAL = 'bug_tracking_bugss';
 const COLLECTION_SINGULAR = 'bug_tracking_bugs';
 // const CACHE_TTL = 60 * 1000; // 1 minute cache for bugs
 
+/** Maximum number of in-flight requests during bulk updates */
+const BULK_UPDATE_CONCURRENCY = 16;
+
+/** Short TTL for cached bugs patched locally after an update instead of refetched */
+const MERGED_BUG_CACHE_TTL = 30 * 1000; // 30 seconds
+
+/**
+ * Canonical instances of low-cardinality bug fields
+ * Decoded rows share these instead of allocating a string per row
+ */
+const STATUS_POOL = createStringPool(Object.values(BugStatus));
+const PRIORITY_POOL = createStringPool(Object.values(BugPriority));
+const SEVERITY_POOL = createStringPool(Object.values(BugSeverity));
+const TYPE_POOL = createStringPool<BugType>(['bug', 'epic', 'task', 'suggestion']);
+
+/**
+ * Decoded bugs keyed by `${id}:${updatedAt}`, shared across all repository calls
+ * Unchanged rows seen again in later scans skip decoding entirely
+ */
+const decodedBugCache = new LRUCache<string, Bug>({ max: 10000 });
+
 /**
  * Converts tags array to comma-separated string for Collection DB storage
  */
@@ -41,6 +64,15 @@ function tagsFromString(tagsStr: string): BugTag[] {
   return tagsStr.split(',').map(t => t.trim() as BugTag);
 }
 
+/**
+ * Drops keys whose value is undefined so a spread does not clear existing fields
+ */
+function withoutUndefined(changes: Partial<Bug>): Partial<Bug> {
+  return Object.fromEntries(
+    Object.entries(changes).filter(([, value]) => value !== undefined)
+  ) as Partial<Bug>;
+}
+
 /**
  * Transforms bug data for Collection DB storage (tags array → string)
  * Also ensures relational fields are stored as arrays
@@ -48,10 +80,11 @@ function tagsFromString(tagsStr: string): BugTag[] {
 function transformBugForStorage(bug: Partial<Bug>): Record<string, unknown> {
   const { tags, projectId, reportedBy, assignedTo, sprintId, ...rest } = bug;
   
-  const storageData: Record<string, unknown> = {
-    ...rest,
-    tags: tags ? tagsToString(tags) : '',
-  };
+  const storageData: Record<string, unknown> = { ...rest };
+
+  if (tags !== undefined) {
+    storageData.tags = tags ? tagsToString(tags) : '';
+  }
 
   if (projectId !== undefined) {
     storageData.projectId = [projectId];
@@ -73,61 +106,47 @@ function transformBugForStorage(bug: Partial<Bug>): Record<string, unknown> {
 }
 
 /**
- * Transforms bug data from Collection DB (tags string → array)
- * Also extracts relational fields from arrays to single values
- * Handles both camelCase and snake_case keys for robustness
+ * Transforms bug data from Collection DB, reusing the result for unchanged rows
+ * Every write bumps updatedAt, so a bug ID plus its raw updatedAt identifies
+ * one version of a bug across repeated scans and requests
  */
 function transformBugFromStorage(bug: Record<string, unknown>): Bug {
-  // Helper to extract single value from array or value
-  const extractSingle = (val: unknown) => {
-    if (Array.isArray(val)) {
-      return val.length > 0 ? val[0] : undefined;
-    }
-    // Handle stringified array case: "['uuid']" or '["uuid"]'
-    if (typeof val === 'string' && val.startsWith('[') && val.endsWith(']')) {
-      try {
-        const parsed = JSON.parse(val.replace(/'/g, '"')); // Handle single quotes if necessary
-        if (Array.isArray(parsed)) {
-          return parsed.length > 0 ? parsed[0] : undefined;
-        }
-      } catch {
-        // Not valid JSON, treat as string
-      }
-    }
-    return val;
-  };
+  const updatedAtRaw = bug.updatedAt || bug.updated;
+  if (!bug.id || !updatedAtRaw) {
+    return decodeBug(bug);
+  }
 
-  // Helper to parse date from string, number, or Date
-  const parseDate = (val: unknown): Date => {
-    if (!val) return new Date(); // Default to now if missing, or handle as invalid?
-    if (val instanceof Date) return val;
-    if (typeof val === 'string' || typeof val === 'number') {
-      const d = new Date(val);
-      return isNaN(d.getTime()) ? new Date() : d;
-    }
-    return new Date();
-  };
+  const key = `${bug.id}:${updatedAtRaw}`;
+  const cached = decodedBugCache.get(key);
+  if (cached) {
+    return cached;
+  }
 
+  const decoded = decodeBug(bug);
+  decodedBugCache.set(key, decoded);
+  return decoded;
+}
+
+/**
+ * Decodes a bug from Collection DB (tags string → array)
+ * Also extracts relational fields from arrays to single values
+ */
+function decodeBug(bug: Record<string, unknown>): Bug {
   // Explicitly map all fields to ensure correctness
-  const id = (bug.id || bug._id || bug.__auto_id__) as string;
+  const id = bug.id as string;
   const title = (bug.title || '') as string;
   const description = (bug.description || '') as string;
-  const status = (bug.status || BugStatus.OPEN) as BugStatus;
-  const priority = (bug.priority || BugPriority.MEDIUM) as BugPriority;
-  const severity = (bug.severity || BugSeverity.MINOR) as BugSeverity;
+  const status = internString(STATUS_POOL, bug.status, BugStatus.OPEN);
+  const priority = internString(PRIORITY_POOL, bug.priority, BugPriority.MEDIUM);
+  const severity = internString(SEVERITY_POOL, bug.severity, BugSeverity.MINOR);
   
-  const projectIdRaw = bug.projectId || bug.project_id;
-  const reportedByRaw = bug.reportedBy || bug.reported_by;
-  const assignedToRaw = bug.assignedTo || bug.assigned_to;
+  const projectId = extractSingle(bug.projectId) as string;
+  const reportedBy = extractSingle(bug.reportedBy) as string;
+  const assignedTo = (extractSingle(bug.assignedTo) as string) || null;
   
-  const projectId = extractSingle(projectIdRaw) as string;
-  const reportedBy = extractSingle(reportedByRaw) as string;
-  const assignedTo = (extractSingle(assignedToRaw) as string) || null;
-  
-  const sprintIdRaw = bug.sprintId || bug.sprint_id;
-  const sprintId = (extractSingle(sprintIdRaw) as string) || null;
+  const sprintId = (extractSingle(bug.sprintId) as string) || null;
 
-  const type = (bug.type || 'bug') as BugType;
+  const type = internString(TYPE_POOL, bug.type, 'bug');
 
   const attachments = (bug.attachments || '') as string;
   const tagsRaw = bug.tags;
@@ -135,11 +154,8 @@ function transformBugFromStorage(bug: Record<string, unknown>): Bug {
   
   const validated = !!bug.validated;
   
-  const createdAtRaw = bug.createdAt || bug.created_at || bug.created;
-  const updatedAtRaw = bug.updatedAt || bug.updated_at || bug.updated;
-  
-  const createdAt = parseDate(createdAtRaw);
-  const updatedAt = parseDate(updatedAtRaw);
+  const createdAt = parseDate(bug.createdAt || bug.created);
+  const updatedAt = parseDate(bug.updatedAt || bug.updated);
 
   return {
     id,
@@ -162,6 +178,9 @@ function transformBugFromStorage(bug: Record<string, unknown>): Bug {
 }
 
 export class BugRepository {
+  /** Fetches currently in flight, keyed by bug ID, so concurrent misses share one request */
+  private readonly pendingFetches = new Map<string, Promise<Bug | null>>();
+
   constructor(
     private readonly collectionDb: CollectionDBService,
     private readonly cacheService?: CacheService
@@ -251,6 +270,7 @@ export class BugRepository {
 
   /**
    * Retrieves a bug by ID
+   * Concurrent lookups of the same uncached bug share a single request
    * @param bugId - Bug ID
    * @returns Bug or null if not found
    * @throws {Error} On server errors
@@ -264,6 +284,38 @@ export class BugRepository {
       }
     }
 
+    // Join a fetch that is already in flight for this bug
+    const pending = this.pendingFetches.get(bugId);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.fetchById(bugId);
+    this.pendingFetches.set(bugId, request);
+
+    try {
+      const transformedBug = await request;
+
+      // Cache the result, unless a write or delete superseded this fetch
+      if (transformedBug && this.cacheService && this.pendingFetches.get(bugId) === request) {
+        this.cacheService.set(`bug:${bugId}`, transformedBug);
+      }
+
+      return transformedBug;
+    } finally {
+      if (this.pendingFetches.get(bugId) === request) {
+        this.pendingFetches.delete(bugId);
+      }
+    }
+  }
+
+  /**
+   * Fetches and transforms a bug from Collection DB, bypassing the cache
+   * @param bugId - Bug ID
+   * @returns Bug or null if not found
+   * @throws {Error} On server errors
+   */
+  private async fetchById(bugId: string): Promise<Bug | null> {
     logger.debug('Fetching bug by ID', { bugId });
 
     const bug = await this.collectionDb.getItemById<Record<string, unknown>>(
@@ -276,16 +328,10 @@ export class BugRepository {
       return null;
     }
 
-    // Transform tags string to array
-    const transformedBug = transformBugFromStorage(bug);
-
-    // Cache the result
-    if (this.cacheService) {
-      this.cacheService.set(`bug:${bugId}`, transformedBug);
-    }
+    logger.debug('Bug fetched successfully', { bugId });
 
-    logger.info('Bug fetched successfully', { bugId });
-    return transformedBug;
+    // Transform tags string to array
+    return transformBugFromStorage(bug);
   }
 
   /**
@@ -311,6 +357,11 @@ export class BugRepository {
   ): Promise<{ bugs: Bug[], lastEvaluatedKey: Record<string, unknown> | null }> {
     logger.debug('Searching bugs', { filters, pageSize, lastEvaluatedKey });
 
+    // Hoist per-query values so the in-memory predicates stay cheap per row
+    const isBacklog = filters.sprintId === 'backlog';
+    const isUnassigned = filters.assignedTo === 'unassigned';
+    const searchQuery = filters.searchQuery ? filters.searchQuery.toLowerCase() : '';
+
     // Define all potential filters with their DB and Memory logic
     // Priority: lower is better (more reductive/important)
     const allFilters: {
@@ -318,14 +369,14 @@ export class BugRepository {
         priority: number;
         isApplicable: boolean;
         addToDb: (arr: FilterQuery[]) => void;
-        applyToMem: (bugs: Bug[]) => Bug[];
+        matches: (bug: Bug) => boolean;
     }[] = [
         {
             id: 'projectId',
             priority: 1,
             isApplicable: !!filters.projectId && filters.projectId !== 'all',
             addToDb: (arr) => arr.push({ field_name: 'payload.project_id', field_value: filters.projectId!, operator: 'like' }),
-            applyToMem: (bugs) => bugs.filter(b => b.projectId === filters.projectId)
+            matches: (b) => b.projectId === filters.projectId
         },
         {
             id: 'sprintId',
@@ -338,20 +389,14 @@ export class BugRepository {
                     arr.push({ field_name: 'payload.sprint_id', field_value: filters.sprintId!, operator: 'like' });
                  }
             },
-            applyToMem: (bugs) => {
-                if (filters.sprintId === 'backlog') return bugs.filter(b => !b.sprintId);
-                return bugs.filter(b => b.sprintId === filters.sprintId);
-            }
+            matches: (b) => isBacklog ? !b.sprintId : b.sprintId === filters.sprintId
         },
         {
             id: 'searchQuery',
             priority: 3,
             isApplicable: !!filters.searchQuery,
             addToDb: (arr) => arr.push({ field_name: 'payload.title', field_value: filters.searchQuery!, operator: 'like' }),
-            applyToMem: (bugs) => {
-                const q = filters.searchQuery!.toLowerCase();
-                return bugs.filter(b => b.title.toLowerCase().includes(q));
-            }
+            matches: (b) => b.title.toLowerCase().includes(searchQuery)
         },
         {
             id: 'assignedTo',
@@ -364,38 +409,35 @@ export class BugRepository {
                     arr.push({ field_name: 'payload.assigned_to', field_value: filters.assignedTo!, operator: 'eq' });
                 }
             },
-            applyToMem: (bugs) => {
-                if (filters.assignedTo === 'unassigned') return bugs.filter(b => !b.assignedTo);
-                return bugs.filter(b => b.assignedTo === filters.assignedTo);
-            }
+            matches: (b) => isUnassigned ? !b.assignedTo : b.assignedTo === filters.assignedTo
         },
         {
             id: 'status',
             priority: 5,
             isApplicable: !!filters.status && (filters.status as string) !== 'all',
             addToDb: (arr) => arr.push({ field_name: 'payload.status', field_value: filters.status!, operator: 'eq' }),
-            applyToMem: (bugs) => bugs.filter(b => b.status === filters.status)
+            matches: (b) => b.status === filters.status
         },
         {
             id: 'type',
             priority: 6,
             isApplicable: !!filters.type && (filters.type as string) !== 'all',
             addToDb: (arr) => arr.push({ field_name: 'payload.type', field_value: filters.type!, operator: 'eq' }),
-            applyToMem: (bugs) => bugs.filter(b => b.type === filters.type)
+            matches: (b) => b.type === filters.type
         },
         {
             id: 'priority',
             priority: 7,
             isApplicable: !!filters.priority && (filters.priority as string) !== 'all',
             addToDb: (arr) => arr.push({ field_name: 'payload.priority', field_value: filters.priority!, operator: 'eq' }),
-            applyToMem: (bugs) => bugs.filter(b => b.priority === filters.priority)
+            matches: (b) => b.priority === filters.priority
         },
         {
             id: 'severity',
             priority: 8,
             isApplicable: !!filters.severity && (filters.severity as string) !== 'all',
             addToDb: (arr) => arr.push({ field_name: 'payload.severity', field_value: filters.severity!, operator: 'eq' }),
-            applyToMem: (bugs) => bugs.filter(b => b.severity === filters.severity)
+            matches: (b) => b.severity === filters.severity
         }
     ];
 
@@ -421,13 +463,16 @@ export class BugRepository {
       }
     );
 
-    // Transform tags string to array for each bug
-    let transformedBugs = result.items.map(transformBugFromStorage);
-
-    // Apply In-Memory Filters
-    memFiltersToApply.forEach(f => {
-        transformedBugs = f.applyToMem(transformedBugs);
-    });
+    // Transform and apply In-Memory Filters in a single pass
+    // Predicates keep priority order, so the most reductive one short-circuits first
+    const memPredicates = memFiltersToApply.map(f => f.matches);
+    const transformedBugs: Bug[] = [];
+    for (const item of result.items) {
+        const bug = transformBugFromStorage(item);
+        if (memPredicates.every(matches => matches(bug))) {
+            transformedBugs.push(bug);
+        }
+    }
 
     logger.info('Bugs searched successfully', { 
         count: transformedBugs.length, 
@@ -581,25 +626,8 @@ export class BugRepository {
   async updateStatus(bugId: string, status: BugStatus): Promise<Bug> {
     logger.debug('Updating bug status', { bugId, status });
 
-    const now = new Date();
-    const updatedBugRaw = await this.collectionDb.updateItem<Record<string, unknown>>(
-      COLLECTION_SINGULAR,
-      bugId,
-      {
-        status,
-        updatedAt: now,
-      },
-      true // Fetch after update
-    );
-
-    const updatedBug = transformBugFromStorage(updatedBugRaw);
-
-    // Update cache
-    if (this.cacheService) {
-      this.cacheService.set(`bug:${bugId}`, updatedBug);
-    }
-
-    return updatedBug;
+    const changes = { status, updatedAt: new Date() };
+    return this.applyUpdate(bugId, changes, changes);
   }
 
   /**
@@ -612,25 +640,8 @@ export class BugRepository {
   async updateAssignment(bugId: string, assignedTo: string | null): Promise<Bug> {
     logger.debug('Updating bug assignment', { bugId, assignedTo });
 
-    const now = new Date();
-    const updatedBugRaw = await this.collectionDb.updateItem<Record<string, unknown>>(
-      COLLECTION_SINGULAR,
-      bugId,
-      {
-        assignedTo,
-        updatedAt: now,
-      },
-      true // Fetch after update
-    );
-
-    const updatedBug = transformBugFromStorage(updatedBugRaw);
-
-    // Update cache
-    if (this.cacheService) {
-      this.cacheService.set(`bug:${bugId}`, updatedBug);
-    }
-
-    return updatedBug;
+    const changes = { assignedTo, updatedAt: new Date() };
+    return this.applyUpdate(bugId, changes, changes);
   }
 
   /**
@@ -643,27 +654,112 @@ export class BugRepository {
   async update(bugId: string, updates: UpdateBugInput): Promise<Bug> {
     logger.debug('Updating bug', { bugId, updates });
 
-    const now = new Date();
+    const changes = { ...updates, updatedAt: new Date() };
     // Transform tags array to string if present
-    const storageUpdates = transformBugForStorage({
-      ...updates,
-      updatedAt: now,
-    });
+    const storageUpdates = transformBugForStorage(changes);
+
+    return this.applyUpdate(bugId, storageUpdates, changes);
+  }
+
+  /**
+   * Applies many independent bug updates concurrently
+   * At most BULK_UPDATE_CONCURRENCY updates are in flight at once, which avoids
+   * both one-at-a-time round trips and flooding Collection DB with requests
+   * @param operations - Bug IDs paired with their partial updates
+   * @returns Updated bugs, in the same order as the operations
+   * @throws {Error} If a bug ID appears more than once, or if any of the updates fails
+   */
+  async bulkUpdate(operations: { bugId: string; updates: UpdateBugInput }[]): Promise<Bug[]> {
+    logger.debug('Bulk updating bugs', { count: operations.length });
+
+    // Concurrent updates to the same bug would race on its cache entry,
+    // so each bug may appear only once per batch
+    const seenBugIds = new Set<string>();
+    for (const { bugId } of operations) {
+      if (seenBugIds.has(bugId)) {
+        throw new Error(`Duplicate bug ID in bulk update: ${bugId}`);
+      }
+      seenBugIds.add(bugId);
+    }
+
+    const updatedBugs: Bug[] = new Array(operations.length);
+    let nextIndex = 0;
+    let failed = false;
+
+    // Each worker keeps pulling the next pending operation until none are left,
+    // and all of them stop starting new writes once any update has failed
+    const worker = async (): Promise<void> => {
+      while (!failed && nextIndex < operations.length) {
+        const index = nextIndex++;
+        const { bugId, updates } = operations[index];
+        try {
+          updatedBugs[index] = await this.update(bugId, updates);
+        } catch (error) {
+          failed = true;
+          throw error;
+        }
+      }
+    };
+
+    const workerCount = Math.min(BULK_UPDATE_CONCURRENCY, operations.length);
+    await Promise.all(Array.from({ length: workerCount }, () => worker()));
+
+    logger.info('Bugs bulk updated successfully', { count: updatedBugs.length });
+    return updatedBugs;
+  }
+
+  /**
+   * Writes storage-format updates for a bug and returns the updated bug
+   * When the bug is cached, the changes are merged into the cached copy and
+   * the post-update fetch is skipped, saving a network round trip per write
+   * @param bugId - Bug ID
+   * @param storageUpdates - Updates in Collection DB storage format
+   * @param changes - The same updates as Bug fields, used for the cached merge
+   * @returns Updated bug
+   * @throws {Error} On validation errors, not found, or server errors
+   */
+  private async applyUpdate(
+    bugId: string,
+    storageUpdates: Record<string, unknown>,
+    changes: Partial<Bug>
+  ): Promise<Bug> {
+    const cacheKey = `bug:${bugId}`;
+    const fetchAfterUpdate = !this.cacheService?.get<Bug>(cacheKey);
+
+    // A fetch that started before this write must not cache the old version
+    this.pendingFetches.delete(bugId);
 
     const updatedBugRaw = await this.collectionDb.updateItem<Record<string, unknown>>(
       COLLECTION_SINGULAR,
       bugId,
       storageUpdates,
-      true // Fetch after update
+      fetchAfterUpdate
     );
 
-    const updatedBug = transformBugFromStorage(updatedBugRaw);
+    if (fetchAfterUpdate) {
+      const updatedBug = transformBugFromStorage(updatedBugRaw);
+      this.cacheService?.set(cacheKey, updatedBug);
+      return updatedBug;
+    }
 
-    // Update cache
-    if (this.cacheService) {
-      this.cacheService.set(`bug:${bugId}`, updatedBug);
+    // Re-read the cache after the write so overlapping updates to the same bug
+    // merge into each other's results instead of the copy seen before the await
+    const cachedBug = this.cacheService?.get<Bug>(cacheKey);
+    if (!cachedBug) {
+      // Evicted while the write was in flight, so there is nothing to merge into
+      const fetchedBug = await this.fetchById(bugId);
+      if (!fetchedBug) {
+        throw new Error(`Resource not found: ${COLLECTION_SINGULAR}/${bugId}`);
+      }
+      this.cacheService?.set(cacheKey, fetchedBug);
+      return fetchedBug;
     }
 
+    const updatedBug: Bug = { ...cachedBug, ...withoutUndefined(changes), id: bugId };
+
+    // The merged copy never saw the server, so keep it only briefly
+    this.cacheService?.set(cacheKey, updatedBug, MERGED_BUG_CACHE_TTL);
+
     return updatedBug;
   }
 
@@ -682,6 +778,7 @@ export class BugRepository {
     if (this.cacheService) {
       this.cacheService.delete(`bug:${bugId}`);
     }
+    this.pendingFetches.delete(bugId);
 
     logger.info('Bug deleted successfully', { bugId });
     return deleted;
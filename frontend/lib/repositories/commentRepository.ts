@@ -13,17 +13,25 @@
  * Requirements: 5.1, 5.2, 5.3, 5.4, 5.6
  */
 
+import { LRUCache } from 'lru-cache';
 import { CollectionDBService } from '../services/collectionDb';
 import { CacheService } from '../services/cacheService';
 import { Comment, CreateCommentInput } from '../models/comment';
 import { Bug } from '../models/bug';
 import { User } from '../models/user';
 import { logger } from '../utils/logger';
-import { tagsFromString } from '../utils/transformers';
+import { extractSingle, parseDate, sortByKeys, tagsFromString } from '../utils/transformers';
 
 const COLLECTION_PLURAL = 'bug_tracking_commentss';
 const COLLECTION_SINGULAR = 'bug_tracking_comments';
 
+/**
+ * Decoded comments keyed by ID, shared across all repository calls
+ * Comments are never edited, so an ID identifies one immutable comment;
+ * entries are dropped when the comment is deleted
+ */
+const decodedCommentCache = new LRUCache<string, Comment>({ max: 2048 });
+
 /**
  * Transforms comment data for Collection DB storage
  * Ensures relational fields are stored as arrays
@@ -45,52 +53,36 @@ function transformCommentForStorage(comment: Partial<Comment>): Record<string, u
 }
 
 /**
- * Transforms comment data from Collection DB
- * Extracts relational fields from arrays to single values
- * Handles both camelCase and snake_case keys for robustness
+ * Transforms comment data from Collection DB, reusing previously decoded comments
  */
 function transformCommentFromStorage(comment: Record<string, unknown>): Comment {
-  // Helper to extract single value from array or value
-  const extractSingle = (val: unknown) => {
-    if (Array.isArray(val)) {
-      return val.length > 0 ? val[0] : undefined;
-    }
-    // Handle stringified array case
-    if (typeof val === 'string' && val.startsWith('[') && val.endsWith(']')) {
-      try {
-        const parsed = JSON.parse(val.replace(/'/g, '"'));
-        if (Array.isArray(parsed)) {
-          return parsed.length > 0 ? parsed[0] : undefined;
-        }
-      } catch {
-        // Ignore
-      }
-    }
-    return val;
-  };
+  const id = comment.id as string | undefined;
+  if (!id) {
+    return decodeComment(comment);
+  }
 
-  // Helper to parse date from string, number, or Date
-  const parseDate = (val: unknown): Date => {
-    if (!val) return new Date();
-    if (val instanceof Date) return val;
-    if (typeof val === 'string' || typeof val === 'number') {
-      const d = new Date(val);
-      return isNaN(d.getTime()) ? new Date() : d;
-    }
-    return new Date();
-  };
+  const cached = decodedCommentCache.get(id);
+  if (cached) {
+    return cached;
+  }
+
+  const decoded = decodeComment(comment);
+  decodedCommentCache.set(id, decoded);
+  return decoded;
+}
 
-  const id = (comment.id || comment._id || comment.__auto_id__) as string;
+/**
+ * Decodes comment data from Collection DB
+ * Extracts relational fields from arrays to single values
+ */
+function decodeComment(comment: Record<string, unknown>): Comment {
+  const id = comment.id as string;
   const message = (comment.message || '') as string;
   
-  const bugIdRaw = comment.bugId || comment.bug_id;
-  const authorIdRaw = comment.authorId || comment.author_id;
-  
-  const bugId = extractSingle(bugIdRaw) as string;
-  const authorId = extractSingle(authorIdRaw) as string;
+  const bugId = extractSingle(comment.bugId) as string;
+  const authorId = extractSingle(comment.authorId) as string;
   
-  const createdAtRaw = comment.createdAt || comment.created_at || comment.created;
-  const createdAt = parseDate(createdAtRaw);
+  const createdAt = parseDate(comment.createdAt || comment.created);
 
   return {
     id,
@@ -129,7 +121,13 @@ export class CommentRepository {
       storageData
     );
 
-    const comment = transformCommentFromStorage(createdComment);
+    const comment: Comment = {
+      id: createdComment.id as string,
+      bugId: commentToCreate.bugId,
+      authorId: commentToCreate.authorId,
+      message: commentToCreate.message,
+      createdAt: commentToCreate.createdAt,
+    };
 
     // Update cache for bug comments (Write-Through)
     if (this.cacheService) {
@@ -214,9 +212,11 @@ export class CommentRepository {
 
   /**
    * Fetches all comments associated with a specific bug.
+   * The bug filter runs server-side, and the comments are sorted once here
+   * so cached lists and callers always see them in chronological order.
    * 
    * @param {string} bugId - The ID of the bug to fetch comments for.
-   * @returns {Promise<Comment[]>} A promise that resolves to an array of comments for the given bug.
+   * @returns {Promise<Comment[]>} A promise that resolves to the bug's comments, oldest first.
    * @throws {Error} If the database query fails.
    */
   async getByBug(bugId: string): Promise<Comment[]> {
@@ -230,22 +230,39 @@ export class CommentRepository {
 
     logger.debug('Fetching comments by bug', { bugId });
 
-    const comments = await this.collectionDb.queryItems<Record<string, unknown>>(
+    // Filter, decode and take each comment's sort key in one pass per page.
+    // The 'like' filter is a substring match, so rows whose bug ID merely
+    // contains this one are skipped before decoding
+    const matchedComments: Comment[] = [];
+    const createdAtKeys: number[] = [];
+    await this.collectionDb.scanItems<Record<string, unknown>>(
       COLLECTION_PLURAL,
-      [
-        {
-          field_name: 'payload.bug_id',
-          field_value: bugId,
-          operator: 'like',
-        },
-      ],
+      (items) => {
+        for (const item of items) {
+          if (extractSingle(item.bugId) !== bugId) {
+            continue;
+          }
+          const comment = transformCommentFromStorage(item);
+          matchedComments.push(comment);
+          createdAtKeys.push(comment.createdAt.getTime());
+        }
+      },
       {
+        filter: [
+          {
+            field_name: 'payload.bug_id',
+            field_value: bugId,
+            operator: 'like',
+          },
+        ],
         includeDetail: false,
         pageSize: 1000,
       }
     );
 
-    const transformedComments = comments.map(transformCommentFromStorage);
+    // Collection DB has no ORDER BY, so sort oldest first before caching;
+    // create() appends to the cached list, which keeps it in order
+    const transformedComments = sortByKeys(matchedComments, createdAtKeys);
 
     // Cache the result
     if (this.cacheService) {
@@ -278,6 +295,7 @@ export class CommentRepository {
     const deleted = await this.collectionDb.deleteItem(COLLECTION_SINGULAR, commentId);
 
     // Invalidate caches
+    decodedCommentCache.delete(commentId);
     if (this.cacheService) {
       this.cacheService.delete(`comment:${commentId}`);
       if (bugId) {
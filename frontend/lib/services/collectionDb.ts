@@ -207,6 +207,8 @@ export class CollectionDBService {
   /**
    * Parses Collection DB response and transforms to application format
    * Handles nested payload structures and field name conversion
+   * Keys are converted to camelCase and the ID is resolved here, once per item,
+   * so repository transforms can read camelCase fields directly
    * 
    * ID Handling:
    * - Extracts __auto_id__ from Collection DB response as the primary ID
@@ -227,12 +229,14 @@ export class CollectionDBService {
     const autoId = response.__auto_id__ || dataWithId.__auto_id__;
     
     // Convert snake_case to camelCase
-    const camelCaseData = keysToCamelCase(data);
+    // keysToCamelCase already returns a fresh object, so the ID is set on it
+    // directly rather than copying every field again with a spread
+    const camelCaseData = keysToCamelCase<Record<string, unknown>>(data);
     
     // Handle ID injection with conflict detection
     if (autoId) {
       // Always use __auto_id__ as the authoritative ID
-      return { ...camelCaseData, id: autoId } as T;
+      camelCaseData.id = autoId;
     }
     
     return camelCaseData as T;
@@ -321,6 +325,62 @@ export class CollectionDBService {
     return this.parseResponse<T>(result);
   }
 
+  /**
+   * Locates the items array in a list response and parses every item in one pass
+   * 
+   * Collection DB response format:
+   * {
+   *   "Collection": "collection_name",
+   *   "last_evaluated_key": null,
+   *   "<uuid>": [ array of items ],
+   *   "published_collections_detail": [...]
+   * }
+   * 
+   * @param result - Raw JSON list response
+   * @param collectionPlural - Plural collection name (for logging)
+   * @returns Parsed items
+   * @private
+   */
+  private extractItems<T>(result: unknown, collectionPlural: string): T[] {
+    let items: unknown[] = [];
+    
+    if (Array.isArray(result)) {
+      // Direct array response
+      items = result;
+    } else if (result && typeof result === 'object') {
+      const record = result as Record<string, unknown>;
+      // Find the UUID key that contains the items array
+      for (const key of Object.keys(record)) {
+        // Skip known metadata keys
+        if (key === 'Collection' || key === 'last_evaluated_key' || key === 'published_collections_detail') {
+          continue;
+        }
+        // Check if this key contains an array (the actual items)
+        if (Array.isArray(record[key])) {
+          items = record[key] as unknown[];
+          logger.debug('Found items in UUID key', { 
+            collection: collectionPlural, 
+            uuidKey: key,
+            count: items.length 
+          });
+          break;
+        }
+      }
+      
+      // Fallback to items property if no UUID key found
+      if (items.length === 0 && Array.isArray(record.items)) {
+        items = record.items;
+      }
+    }
+
+    // Parse into a preallocated array in a single indexed pass
+    const parsed: T[] = new Array(items.length);
+    for (let i = 0; i < items.length; i++) {
+      parsed[i] = this.parseResponse<T>(items[i] as CollectionDBResponse<unknown>);
+    }
+    return parsed;
+  }
+
   /**
    * Retrieves all items from a collection
    * @param collectionPlural - Plural collection name
@@ -348,52 +408,14 @@ export class CollectionDBService {
     }
 
     const result = await response.json();
-    
-    // Collection DB response format:
-    // {
-    //   "Collection": "collection_name",
-    //   "last_evaluated_key": null,
-    //   "<uuid>": [ array of items ],
-    //   "published_collections_detail": [...]
-    // }
-    
-    let items: unknown[] = [];
-    
-    if (Array.isArray(result)) {
-      // Direct array response
-      items = result;
-    } else if (result && typeof result === 'object') {
-      // Find the UUID key that contains the items array
-      const keys = Object.keys(result);
-      for (const key of keys) {
-        // Skip known metadata keys
-        if (key === 'Collection' || key === 'last_evaluated_key' || key === 'published_collections_detail') {
-          continue;
-        }
-        // Check if this key contains an array (the actual items)
-        if (Array.isArray(result[key])) {
-          items = result[key];
-          logger.debug('Found items in UUID key', { 
-            collection: collectionPlural, 
-            uuidKey: key,
-            count: items.length 
-          });
-          break;
-        }
-      }
-      
-      // Fallback to items property if no UUID key found
-      if (items.length === 0 && result.items) {
-        items = result.items;
-      }
-    }
+    const items = this.extractItems<T>(result, collectionPlural);
     
     logger.info('Items fetched successfully', {
       collection: collectionPlural,
       count: items.length,
     });
 
-    return items.map((item: unknown) => this.parseResponse<T>(item as CollectionDBResponse<unknown>));
+    return items;
   }
 
   /**
@@ -417,43 +439,10 @@ export class CollectionDBService {
     }
 
     const result = await response.json();
-    
-    let items: unknown[] = [];
-    let lastEvaluatedKey: Record<string, unknown> | null = null;
-    
-    if (Array.isArray(result)) {
-      // Direct array response
-      items = result;
-    } else if (result && typeof result === 'object') {
-      // Extract last_evaluated_key
-      if (result.last_evaluated_key) {
-        lastEvaluatedKey = result.last_evaluated_key as Record<string, unknown>;
-      }
-
-      // Find the UUID key that contains the items array
-      const keys = Object.keys(result);
-      for (const key of keys) {
-        // Skip known metadata keys
-        if (key === 'Collection' || key === 'last_evaluated_key' || key === 'published_collections_detail') {
-          continue;
-        }
-        // Check if this key contains an array (the actual items)
-        if (Array.isArray(result[key])) {
-          items = result[key];
-          logger.debug('Found items in UUID key', { 
-            collection: collectionPlural, 
-            uuidKey: key,
-            count: items.length 
-          });
-          break;
-        }
-      }
-      
-      // Fallback to items property if no UUID key found
-      if (items.length === 0 && result.items) {
-        items = result.items;
-      }
-    }
+    const items = this.extractItems<T>(result, collectionPlural);
+    const lastEvaluatedKey = !Array.isArray(result) && result && result.last_evaluated_key
+      ? result.last_evaluated_key as Record<string, unknown>
+      : null;
     
     logger.info('Items fetched successfully', {
       collection: collectionPlural,
@@ -462,11 +451,45 @@ export class CollectionDBService {
     });
 
     return {
-      items: items.map((item: unknown) => this.parseResponse<T>(item as CollectionDBResponse<unknown>)),
+      items,
       lastEvaluatedKey
     };
   }
 
+  /**
+   * Visits every item in a collection, one page at a time
+   * Only the current page is held in memory, so callers that reduce the items
+   * as they arrive (e.g. keeping the newest K) never materialize the whole collection
+   * @param collectionPlural - Plural collection name
+   * @param onPage - Called with each page of items, in order
+   * @param options - Query options (pagination cursor is managed internally)
+   * @returns Total number of items visited
+   * @throws {Error} On server errors
+   * @example
+   * await service.scanItems('bug_tracking_activitiess', (items) => {
+   *   items.forEach(item => process(item));
+   * }, { includeDetail: false, pageSize: 1000 });
+   */
+  async scanItems<T>(
+    collectionPlural: string,
+    onPage: (items: T[]) => void,
+    options?: Omit<QueryOptions, 'lastEvaluatedKey'>
+  ): Promise<number> {
+    let lastEvaluatedKey: string | null = null;
+    let count = 0;
+
+    do {
+      const page: { items: T[], lastEvaluatedKey: Record<string, unknown> | null } =
+        await this.getAllItemsPaginated<T>(collectionPlural, { ...options, lastEvaluatedKey });
+      onPage(page.items);
+      count += page.items.length;
+      lastEvaluatedKey = page.lastEvaluatedKey ? JSON.stringify(page.lastEvaluatedKey) : null;
+    } while (lastEvaluatedKey);
+
+    logger.debug('Collection scan complete', { collection: collectionPlural, count });
+    return count;
+  }
+
   /**
    * Retrieves a single item by ID
    * @param collectionSingular - Singular collection name
@@ -498,7 +521,7 @@ export class CollectionDBService {
     }
 
     const result = await response.json();
-    logger.info('Item fetched successfully', {
+    logger.debug('Item fetched successfully', {
       collection: collectionSingular,
       id,
     });
@@ -570,7 +593,7 @@ export class CollectionDBService {
     }
 
     if (!fetchAfterUpdate) {
-      logger.info('Item updated successfully, skipping fetch', {
+      logger.debug('Item updated successfully, skipping fetch', {
         collection: collectionSingular,
         id,
       });
@@ -582,7 +605,7 @@ export class CollectionDBService {
 
     // Update successful - now fetch the updated item
     // Collection DB UPDATE may not return the full item, so we fetch it
-    logger.info('Item updated successfully, fetching updated item', {
+    logger.debug('Item updated successfully, fetching updated item', {
       collection: collectionSingular,
       id,
     });
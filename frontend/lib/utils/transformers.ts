@@ -4,6 +4,55 @@
  * and TypeScript application format
  */
 
+import { LRUCache } from 'lru-cache';
+
+/**
+ * Upper bound on memoized key conversions, guarding against unbounded growth
+ * if payloads ever carry dynamic keys
+ */
+const MAX_MEMOIZED_KEYS = 1000;
+
+/**
+ * Memoized key conversions
+ * Collection DB payloads reuse a small, fixed set of field names, so each name
+ * is converted once instead of running a regex per key of every row
+ */
+const snakeCaseKeys = new Map<string, string>();
+const camelCaseKeys = new Map<string, string>();
+
+/**
+ * Memoized results of parsing stringified relation arrays (e.g. "['uuid']")
+ * Relation values repeat across rows and entities, so each distinct string is parsed once
+ */
+const parsedArrayCache = new LRUCache<string, unknown[]>({ max: 4096 });
+
+/** Matches single quotes in Python-style stringified arrays */
+const SINGLE_QUOTE_PATTERN = /'/g;
+
+/**
+ * Matches a stringified array holding one plain quoted string, e.g. "['uuid']"
+ * This is the usual shape of a stored relation, and the capture is its value
+ */
+const SINGLE_ELEMENT_ARRAY_PATTERN = /^\[\s*['"]([^'"\\]*)['"]\s*\]$/;
+
+/**
+ * Converts a key using a memo table
+ * @param memo - Memo table for this conversion direction
+ * @param key - Key to convert
+ * @param convert - Conversion to apply on a memo miss
+ * @returns Converted key
+ */
+function convertKey(memo: Map<string, string>, key: string, convert: (str: string) => string): string {
+  let converted = memo.get(key);
+  if (converted === undefined) {
+    converted = convert(key);
+    if (memo.size < MAX_MEMOIZED_KEYS) {
+      memo.set(key, converted);
+    }
+  }
+  return converted;
+}
+
 /**
  * Converts a camelCase string to snake_case
  * @param str - The camelCase string to convert
@@ -27,6 +76,8 @@ export function toSnakeCase(str: string): string {
  */
 export function toCamelCase(str: string): string {
   if (!str) return str;
+  // Cheap substring check first: keys without underscores need no regex pass
+  if (str.indexOf('_') === -1) return str;
   return str.replace(/_([a-z])/g, (_, letter) => letter.toUpperCase());
 }
 
@@ -59,7 +110,7 @@ export function keysToCamelCase<T = any>(obj: Record<string, any>): T {
   const result: Record<string, any> = {};
   
   for (const [key, value] of Object.entries(obj)) {
-    const camelKey = toCamelCase(key);
+    const camelKey = convertKey(camelCaseKeys, key, toCamelCase);
     
     if (value instanceof Date) {
       result[camelKey] = value;
@@ -106,7 +157,7 @@ export function keysToSnakeCase<T = any>(obj: Record<string, any>): T {
   const result: Record<string, any> = {};
   
   for (const [key, value] of Object.entries(obj)) {
-    const snakeKey = toSnakeCase(key);
+    const snakeKey = convertKey(snakeCaseKeys, key, toSnakeCase);
     
     if (value instanceof Date) {
       result[snakeKey] = value;
@@ -213,3 +264,134 @@ export function bugTagsToString(tags: string[]): string {
 export function bugTagsFromString(tagsStr: string): string[] {
   return tagsFromString(tagsStr);
 }
+
+/**
+ * Builds a pool of canonical string instances for a low-cardinality field
+ * @param values - Known values of the field (e.g. enum values)
+ * @returns Map from each value to its canonical instance
+ * @example
+ * const statusPool = createStringPool(Object.values(BugStatus));
+ */
+export function createStringPool<T extends string>(values: readonly T[]): Map<string, T> {
+  return new Map<string, T>(values.map(value => [value, value] as [string, T]));
+}
+
+/**
+ * Maps a decoded string onto its canonical pooled instance
+ * Rows decoded from Collection DB each carry their own copy of values like
+ * 'Open' or 'Medium'; interning lets all rows share a single instance
+ * @param pool - Pool created with createStringPool
+ * @param value - Raw decoded value
+ * @param fallback - Value to use when the raw value is missing
+ * @returns Pooled instance, the raw value if unknown, or the fallback
+ * @example
+ * internString(statusPool, 'Open', BugStatus.OPEN) // returns BugStatus.OPEN
+ */
+export function internString<T extends string>(pool: Map<string, T>, value: unknown, fallback: T): T {
+  if (!value) {
+    return fallback;
+  }
+  if (typeof value !== 'string') {
+    return value as T;
+  }
+  return pool.get(value) ?? (value as T);
+}
+
+/**
+ * Parses a stringified relation array, serving repeat values from the memo
+ * @returns Parsed array, or null if the string is not a valid JSON array
+ */
+function parseStringifiedArray(val: string): unknown[] | null {
+  const cached = parsedArrayCache.get(val);
+  if (cached) {
+    return cached;
+  }
+
+  try {
+    // Only pay for the quote-normalizing copy when the value actually needs it
+    const json = val.indexOf("'") === -1 ? val : val.replace(SINGLE_QUOTE_PATTERN, '"');
+    const parsed = JSON.parse(json);
+    if (Array.isArray(parsed)) {
+      parsedArrayCache.set(val, parsed);
+      return parsed;
+    }
+  } catch {
+    // Not valid JSON, treat as string
+  }
+  return null;
+}
+
+/**
+ * Extracts a single value from a Collection DB relation field
+ * Relations are stored as arrays, or occasionally as stringified arrays
+ * @param val - Raw relation value
+ * @returns First element of the relation, or the value itself if not an array
+ * @example
+ * extractSingle(['uuid']) // returns 'uuid'
+ * extractSingle("['uuid']") // returns 'uuid'
+ * extractSingle('uuid') // returns 'uuid'
+ */
+export function extractSingle(val: unknown): unknown {
+  if (Array.isArray(val)) {
+    return val.length > 0 ? val[0] : undefined;
+  }
+  // Handle stringified array case: "['uuid']" or '["uuid"]'
+  if (typeof val === 'string' && val.startsWith('[') && val.endsWith(']')) {
+    // Fast path: a single plain element is read straight out of the match,
+    // without JSON parsing or a memo lookup
+    const match = SINGLE_ELEMENT_ARRAY_PATTERN.exec(val);
+    if (match) {
+      return match[1];
+    }
+    const parsed = parseStringifiedArray(val);
+    if (parsed) {
+      return parsed.length > 0 ? parsed[0] : undefined;
+    }
+  }
+  return val;
+}
+
+/**
+ * Parses a Collection DB timestamp from string, number, or Date
+ * @param val - Raw timestamp value
+ * @returns Parsed date, or the current time if missing or invalid
+ * @example
+ * parseDate('2024-01-15T10:30:00.000Z') // returns Date object
+ */
+export function parseDate(val: unknown): Date {
+  if (!val) return new Date();
+  if (val instanceof Date) return val;
+  if (typeof val === 'string' || typeof val === 'number') {
+    const d = new Date(val);
+    return isNaN(d.getTime()) ? new Date() : d;
+  }
+  return new Date();
+}
+
+/**
+ * Sorts items by a numeric key, computing each item's key exactly once
+ * Sorting by e.g. date.getTime() in a comparator recomputes both keys on every
+ * comparison; here the keys are extracted up front and compared as plain numbers
+ * @param items - Items to sort (not modified)
+ * @param keyOf - Extracts the numeric sort key of an item
+ * @param descending - Sort largest key first
+ * @returns New array of the items in key order (stable for equal keys)
+ * @example
+ * sortByKey(comments, c => c.createdAt.getTime()) // oldest first
+ */
+export function sortByKey<T>(items: T[], keyOf: (item: T) => number, descending = false): T[] {
+  return sortByKeys(items, items.map(keyOf), descending);
+}
+
+/**
+ * Sorts items by keys the caller already computed, e.g. while building the items
+ * @param items - Items to sort (not modified)
+ * @param keys - Numeric sort key of each item, by index
+ * @param descending - Sort largest key first
+ * @returns New array of the items in key order (stable for equal keys)
+ */
+export function sortByKeys<T>(items: T[], keys: number[], descending = false): T[] {
+  const order = items.map((_, index) => index);
+  order.sort(descending ? (a, b) => keys[b] - keys[a] : (a, b) => keys[a] - keys[b]);
+  return order.map(index => items[index]);
+}
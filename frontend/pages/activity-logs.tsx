@@ -3,14 +3,14 @@ import { useRouter } from 'next/router';
 import { LoadingState } from '../components/LoadingState';
 import { ActivityLog } from '../utils/types';
 import { useActivityLogs } from '../lib/hooks/useData';
+import { formatTimeOfDay } from '../utils/badgeHelpers';
+import { GroupedLogs, getActionIcon, groupLogsByDay } from '../utils/activityHelpers';
+import { getInitials } from '../lib/utils';
 import { 
   Search, 
   ChevronDown, 
   Plus, 
-  MessageSquare, 
-  RefreshCw, 
-  UserPlus, 
-  Ticket,
+  RefreshCw,
   Clock
 } from 'lucide-react';
 
@@ -26,78 +26,58 @@ import {
  * - Smooth hover states and interactions
  */
 
-interface GroupedLogs {
-  [key: string]: ActivityLog[];
+/**
+ * Formats an activity time as relative for the last day, else as a time of day
+ * Defined at module scope so it is not re-created on every render
+ */
+function formatTimestamp(timestamp: string | Date): string {
+  const date = typeof timestamp === 'string' ? new Date(timestamp) : timestamp;
+  const now = new Date();
+  const diff = now.getTime() - date.getTime();
+  
+  const minutes = Math.floor(diff / 60000);
+  const hours = Math.floor(diff / 3600000);
+  
+  if (minutes < 1) return 'Just now';
+  if (minutes < 60) return `${minutes}m ago`;
+  if (hours < 24) return `${hours}h ago`;
+  
+  return formatTimeOfDay(date);
 }
 
 const ActivityLogsPage: React.FC = () => {
   const router = useRouter();
-  const { activityLogs, isLoading: loading, isError: error, mutate: refreshLogs } = useActivityLogs();
+  const { activityLogs, isLoading: loading, isValidating: refreshing, isError: error, mutate: refreshLogs } = useActivityLogs();
   const [searchQuery, setSearchQuery] = useState('');
 
   // Group logs by date
-  const groupedLogs = useMemo(() => {
-    const groups: GroupedLogs = {};
-    const now = new Date();
-    
+  const groupedLogs = useMemo(() => groupLogsByDay(activityLogs), [activityLogs]);
+
+  // Lowercased searchable text per log, built once per fetch rather than per keystroke
+  // Fields are joined with a newline so a query cannot match across two fields
+  const searchText = useMemo(() => {
+    const text = new Map<string, string>();
     activityLogs.forEach((log) => {
-      const logDate = new Date(log.timestamp);
-      const diffDays = Math.floor((now.getTime() - logDate.getTime()) / (1000 * 60 * 60 * 24));
-      
-      let groupKey: string;
-      if (diffDays === 0) {
-        groupKey = 'Today';
-      } else if (diffDays === 1) {
-        groupKey = 'Yesterday';
-      } else if (diffDays < 7) {
-        groupKey = logDate.toLocaleDateString('en-US', { weekday: 'long' });
-      } else {
-        groupKey = logDate.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
-      }
-      
-      if (!groups[groupKey]) {
-        groups[groupKey] = [];
-      }
-      groups[groupKey].push(log);
+      text.set(log.id, [log.performedByName, log.bugTitle, log.projectName, log.action].join('\n').toLowerCase());
     });
-    
-    return groups;
+    return text;
   }, [activityLogs]);
 
   // Filter logs based on search
   const filteredGroups = useMemo(() => {
     if (!searchQuery.trim()) return groupedLogs;
     
+    const query = searchQuery.toLowerCase();
     const filtered: GroupedLogs = {};
     Object.entries(groupedLogs).forEach(([key, logs]) => {
-      const matchedLogs = logs.filter(log => 
-        log.performedByName.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        log.bugTitle.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        log.projectName.toLowerCase().includes(searchQuery.toLowerCase()) ||
-        log.action.toLowerCase().includes(searchQuery.toLowerCase())
-      );
+      const matchedLogs = logs.filter(log => (searchText.get(log.id) || '').includes(query));
       if (matchedLogs.length > 0) {
         filtered[key] = matchedLogs;
       }
     });
     
     return filtered;
-  }, [groupedLogs, searchQuery]);
-
-  const getActionIcon = (action: string) => {
-    switch (action) {
-      case 'reported':
-        return <Ticket className="w-4 h-4" />;
-      case 'assigned':
-        return <UserPlus className="w-4 h-4" />;
-      case 'status_changed':
-        return <RefreshCw className="w-4 h-4" />;
-      case 'validated':
-        return <MessageSquare className="w-4 h-4" />;
-      default:
-        return <Ticket className="w-4 h-4" />;
-    }
-  };
+  }, [groupedLogs, searchQuery, searchText]);
 
   const getActionText = (log: ActivityLog): JSX.Element => {
     switch (log.action) {
@@ -172,34 +152,6 @@ const ActivityLogsPage: React.FC = () => {
     }
   };
 
-  const formatTimestamp = (timestamp: string | Date): string => {
-    const date = typeof timestamp === 'string' ? new Date(timestamp) : timestamp;
-    const now = new Date();
-    const diff = now.getTime() - date.getTime();
-    
-    const minutes = Math.floor(diff / 60000);
-    const hours = Math.floor(diff / 3600000);
-    
-    if (minutes < 1) return 'Just now';
-    if (minutes < 60) return `${minutes}m ago`;
-    if (hours < 24) return `${hours}h ago`;
-    
-    return date.toLocaleTimeString('en-US', {
-      hour: 'numeric',
-      minute: '2-digit',
-      hour12: true
-    });
-  };
-
-  const getInitials = (name: string): string => {
-    return name
-      .split(' ')
-      .map(n => n[0])
-      .join('')
-      .toUpperCase()
-      .slice(0, 2);
-  };
-
   if (loading) {
     return <LoadingState message="Loading activity logs..." />;
   }
@@ -211,9 +163,10 @@ const ActivityLogsPage: React.FC = () => {
           <p className="text-red-500 dark:text-red-400 mb-4 text-sm">Failed to load activity logs. Please try again.</p>
           <button
             onClick={() => refreshLogs()}
-            className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded-full text-sm font-medium transition-all shadow-lg hover:shadow-xl"
+            disabled={refreshing}
+            className="px-4 py-2 bg-blue-500 hover:bg-blue-600 text-white rounded-full text-sm font-medium transition-all shadow-lg hover:shadow-xl disabled:opacity-60 disabled:cursor-not-allowed"
           >
-            Retry
+            {refreshing ? 'Retrying...' : 'Retry'}
           </button>
         </div>
       </div>
@@ -225,9 +178,17 @@ const ActivityLogsPage: React.FC = () => {
       <div className="max-w-[1200px] mx-auto px-8 py-6">
         {/* Top Bar */}
         <div className="flex items-center justify-between mb-6">
-          <h1 className="text-2xl font-semibold text-gray-900 dark:text-[#F9FAFB] tracking-tight">
-            Activity Log
-          </h1>
+          <div className="flex items-center gap-3">
+            <h1 className="text-2xl font-semibold text-gray-900 dark:text-[#F9FAFB] tracking-tight">
+              Activity Log
+            </h1>
+            {refreshing && (
+              <span className="flex items-center gap-1.5 text-xs text-gray-400 dark:text-gray-500">
+                <RefreshCw className="w-3 h-3 animate-spin" />
+                Refreshing...
+              </span>
+            )}
+          </div>
           <button className="flex items-center gap-2 px-4 h-9 bg-blue-500 hover:bg-blue-600 dark:bg-blue-500 dark:hover:bg-blue-600 text-white rounded-full text-sm font-medium transition-all shadow-lg hover:shadow-xl">
             <Plus className="w-3.5 h-3.5" />
             Create Ticket
@@ -1,5 +1,5 @@
 import { useRouter } from 'next/router';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { Button } from '@/components/ui/button';
 import { PriorityIcon } from '@/components/PriorityIcon';
 import { Card, CardHeader, CardTitle, CardContent } from '@/components/ui/card';
@@ -67,16 +67,20 @@ export default function Home() {
     fetchAssignedBugs();
   }, [currentUser]);
 
-  // Calculate statistics
-  const statistics: BugStatistics = {
-    total: bugs.length,
-    open: bugs.filter(b => b.status === BugStatus.OPEN).length,
-    inProgress: bugs.filter(b => b.status === BugStatus.IN_PROGRESS).length,
-    resolved: bugs.filter(b => b.status === BugStatus.RESOLVED).length,
-    closed: bugs.filter(b => b.status === BugStatus.CLOSED).length,
-    highest: bugs.filter(b => b.priority === BugPriority.HIGHEST).length,
-    high: bugs.filter(b => b.priority === BugPriority.HIGH).length,
-  };
+  // Calculate statistics in a single pass over the bugs
+  const statistics = useMemo<BugStatistics>(() => {
+    const counts: BugStatistics = { total: bugs.length, open: 0, inProgress: 0, resolved: 0, closed: 0, highest: 0, high: 0 };
+    for (const bug of bugs) {
+      if (bug.status === BugStatus.OPEN) counts.open++;
+      else if (bug.status === BugStatus.IN_PROGRESS) counts.inProgress++;
+      else if (bug.status === BugStatus.RESOLVED) counts.resolved++;
+      else if (bug.status === BugStatus.CLOSED) counts.closed++;
+
+      if (bug.priority === BugPriority.HIGHEST) counts.highest++;
+      else if (bug.priority === BugPriority.HIGH) counts.high++;
+    }
+    return counts;
+  }, [bugs]);
 
   // Active Sprint Logic
   const activeSprint = sprints.find(s => s.status === 'active') || sprints[0];
@@ -91,12 +95,18 @@ export default function Home() {
   const daysRemaining = activeSprint ? Math.ceil((new Date(activeSprint.endDate).getTime() - new Date().getTime()) / (1000 * 60 * 60 * 24)) : 0;
 
 
-  const filteredAssignedBugs = assignedBugs.filter(bug => {
-      if (assignedTab === 'active') return bug.status === BugStatus.IN_PROGRESS;
-      if (assignedTab === 'backlog') return bug.status === BugStatus.OPEN;
-      if (assignedTab === 'review') return bug.status === BugStatus.RESOLVED;
-      return false;
-  });
+  // Bucket assigned bugs by tab once per fetch, so switching tabs is a lookup
+  const assignedBugsByTab = useMemo(() => {
+    const buckets: Record<typeof assignedTab, Bug[]> = { active: [], backlog: [], review: [] };
+    for (const bug of assignedBugs) {
+      if (bug.status === BugStatus.IN_PROGRESS) buckets.active.push(bug);
+      else if (bug.status === BugStatus.OPEN) buckets.backlog.push(bug);
+      else if (bug.status === BugStatus.RESOLVED) buckets.review.push(bug);
+    }
+    return buckets;
+  }, [assignedBugs]);
+
+  const filteredAssignedBugs = assignedBugsByTab[assignedTab];
 
   const handleWelcomeComplete = () => {
     setShowWelcome(false);
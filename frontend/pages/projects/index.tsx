@@ -7,7 +7,7 @@
  * Requirements: 5.1, 5.3
  */
 
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useRouter } from 'next/router';
 import { Button } from '@/components/ui/button';
 import {
@@ -38,19 +38,45 @@ export default function ProjectsPage() {
     router.push(`/projects/${projectId}/sprints`);
   };
 
+  // Index bug and sprint counts by project in one pass over each list,
+  // so every project card is a lookup instead of a full scan
+  const projectCounts = useMemo(() => {
+    const counts: Record<string, { bugs: number; openBugs: number; sprints: number }> = {};
+    const getCounts = (projectId: string) => {
+      if (!counts[projectId]) {
+        counts[projectId] = { bugs: 0, openBugs: 0, sprints: 0 };
+      }
+      return counts[projectId];
+    };
+
+    bugs.forEach(bug => {
+      const entry = getCounts(bug.projectId);
+      entry.bugs++;
+      if (bug.status === 'Open') {
+        entry.openBugs++;
+      }
+    });
+
+    sprints.forEach(sprint => {
+      getCounts(sprint.projectId).sprints++;
+    });
+
+    return counts;
+  }, [bugs, sprints]);
+
   // Get bug count for a project
   const getBugCount = (projectId: string): number => {
-    return bugs.filter(bug => bug.projectId === projectId).length;
+    return projectCounts[projectId]?.bugs ?? 0;
   };
 
   // Get open bug count for a project
   const getOpenBugCount = (projectId: string): number => {
-    return bugs.filter(bug => bug.projectId === projectId && bug.status === 'Open').length;
+    return projectCounts[projectId]?.openBugs ?? 0;
   };
 
   // Get sprint count for a project
   const getSprintCount = (projectId: string): number => {
-    return sprints.filter(sprint => sprint.projectId === projectId).length;
+    return projectCounts[projectId]?.sprints ?? 0;
   };
 
   // Filter projects based on search query
@@ -0,0 +1,79 @@
+/**
+ * Activity Helper Utilities
+ *
+ * Shared grouping and presentation helpers for activity log views
+ * (the activity log page and the per-bug activity panel).
+ */
+
+import React from 'react';
+import { MessageSquare, RefreshCw, Ticket, UserPlus } from 'lucide-react';
+import { ActivityLog } from './types';
+import { formatShortDate, formatWeekday } from './badgeHelpers';
+
+/**
+ * Activity logs keyed by their day group label ("Today", "Yesterday", "Monday", "Jan 15, 2024")
+ */
+export interface GroupedLogs {
+  [key: string]: ActivityLog[];
+}
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+/**
+ * Group activity logs by calendar day, preserving the input order within each group
+ * Day boundaries are computed once, so each log costs a few number comparisons
+ *
+ * @param logs - Activity logs to group
+ * @returns Logs grouped under "Today", "Yesterday", a weekday within the last week, or a short date
+ */
+export function groupLogsByDay(logs: ActivityLog[]): GroupedLogs {
+  const groups: GroupedLogs = {};
+  const now = new Date();
+  const todayStart = new Date(now.getFullYear(), now.getMonth(), now.getDate()).getTime();
+  const yesterdayStart = new Date(now.getFullYear(), now.getMonth(), now.getDate() - 1).getTime();
+  const weekAgo = now.getTime() - 7 * DAY_MS;
+
+  logs.forEach((log) => {
+    const logDate = log.timestamp instanceof Date ? log.timestamp : new Date(log.timestamp);
+    const time = logDate.getTime();
+
+    let groupKey: string;
+    if (time >= todayStart) {
+      groupKey = 'Today';
+    } else if (time >= yesterdayStart) {
+      groupKey = 'Yesterday';
+    } else if (time > weekAgo) {
+      groupKey = formatWeekday(logDate);
+    } else {
+      groupKey = formatShortDate(logDate);
+    }
+
+    if (!groups[groupKey]) {
+      groups[groupKey] = [];
+    }
+    groups[groupKey].push(log);
+  });
+
+  return groups;
+}
+
+/**
+ * Get the timeline icon for an activity action
+ *
+ * @param action - Activity action
+ * @returns Icon element
+ */
+export function getActionIcon(action: string): JSX.Element {
+  switch (action) {
+    case 'reported':
+      return <Ticket className="w-4 h-4" />;
+    case 'assigned':
+      return <UserPlus className="w-4 h-4" />;
+    case 'status_changed':
+      return <RefreshCw className="w-4 h-4" />;
+    case 'validated':
+      return <MessageSquare className="w-4 h-4" />;
+    default:
+      return <Ticket className="w-4 h-4" />;
+  }
+}
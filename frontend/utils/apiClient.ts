@@ -73,40 +73,56 @@ export const handleApiError = (error: unknown): string => {
 };
 
 /**
- * Helper to enrich Activity with related data to match ActivityLog interface
+ * Wraps a by-ID lookup so each distinct ID is fetched at most once
+ * Concurrent and repeated lookups of the same ID share one promise
  */
-const enrichActivity = async (activity: Activity): Promise<ActivityLog> => {
+const memoizeLookup = <T>(fetch: (id: string) => Promise<T | null>) => {
+  const pending = new Map<string, Promise<T | null>>();
+  return (id: string | null | undefined): Promise<T | null> => {
+    if (!id) return Promise.resolve(null);
+    let lookup = pending.get(id);
+    if (!lookup) {
+      lookup = fetch(id);
+      pending.set(id, lookup);
+    }
+    return lookup;
+  };
+};
+
+/**
+ * Helper to enrich Activities with related data to match ActivityLog interface
+ * Bugs, users and projects are resolved once per distinct ID across the batch,
+ * since a page of activities typically references the same few of each
+ */
+const enrichActivities = async (activities: Activity[]): Promise<ActivityLog[]> => {
   const services = getServiceContainer();
-  
-  const [bug, user] = await Promise.all([
-    activity.bugId ? services.getBugRepository().getById(activity.bugId) : Promise.resolve(null),
-    activity.authorId ? services.getUserRepository().getById(activity.authorId) : Promise.resolve(null)
-  ]);
-
-  let project = null;
-  if (bug) {
-    project = await services.getProjectRepository().getById(bug.projectId);
-  }
+  const getBug = memoizeLookup((id) => services.getBugRepository().getById(id));
+  const getUser = memoizeLookup((id) => services.getUserRepository().getById(id));
+  const getProject = memoizeLookup((id) => services.getProjectRepository().getById(id));
 
-  let assignedToName: string | undefined;
-  if (activity.assignedToId) {
-    const assignedUser = await services.getUserRepository().getById(activity.assignedToId);
-    assignedToName = assignedUser?.name;
-  }
+  return Promise.all(activities.map(async (activity): Promise<ActivityLog> => {
+    const [bug, user, assignedUser] = await Promise.all([
+      getBug(activity.bugId),
+      getUser(activity.authorId),
+      getUser(activity.assignedToId),
+    ]);
 
-  return {
-    id: activity.id,
-    bugId: activity.bugId || '',
-    bugTitle: bug?.title || 'Unknown Bug',
-    projectId: project?.id || 'unknown',
-    projectName: project?.name || 'Unknown Project',
-    action: activity.action,
-    performedBy: activity.authorId,
-    performedByName: user?.name || 'Unknown User',
-    newStatus: activity.newStatus,
-    assignedToName,
-    timestamp: activity.timestamp,
-  };
+    const project = bug ? await getProject(bug.projectId) : null;
+
+    return {
+      id: activity.id,
+      bugId: activity.bugId || '',
+      bugTitle: bug?.title || 'Unknown Bug',
+      projectId: project?.id || 'unknown',
+      projectName: project?.name || 'Unknown Project',
+      action: activity.action,
+      performedBy: activity.authorId,
+      performedByName: user?.name || 'Unknown User',
+      newStatus: activity.newStatus,
+      assignedToName: assignedUser?.name,
+      timestamp: activity.timestamp,
+    };
+  }));
 };
 
 // Bug API endpoints
@@ -308,22 +324,22 @@ export const userApi = {
 
 // Activity Log API endpoints
 export const activityLogApi = {
-  getAll: async (): Promise<ActivityLog[]> => {
+  getAll: async (limit?: number): Promise<ActivityLog[]> => {
     const services = getServiceContainer();
-    const activities = await trackRequest(services.getActivityRepository().getAll());
-    return Promise.all(activities.map(enrichActivity));
+    const activities = await trackRequest(services.getActivityRepository().getAll(limit));
+    return enrichActivities(activities);
   },
 
-  getByBugId: async (bugId: string): Promise<ActivityLog[]> => {
+  getByBugId: async (bugId: string, limit?: number): Promise<ActivityLog[]> => {
     const services = getServiceContainer();
-    const activities = await trackRequest(services.getActivityRepository().getByBug(bugId));
-    return Promise.all(activities.map(enrichActivity));
+    const activities = await trackRequest(services.getActivityRepository().getByBug(bugId, limit));
+    return enrichActivities(activities);
   },
 
   getRecent: async (limit: number = 10): Promise<ActivityLog[]> => {
     const services = getServiceContainer();
     const activities = await trackRequest(services.getActivityRepository().getRecent(limit));
-    return Promise.all(activities.map(enrichActivity));
+    return enrichActivities(activities);
   },
 };
 
@@ -5,6 +5,7 @@
  * across the application and reduce code duplication.
  */
 
+import { LRUCache } from 'lru-cache';
 import { BugStatus, BugPriority, BugSeverity } from './types';
 import { BugType } from '@/lib/models/bug';
 import { BADGE_VARIANTS } from './constants';
@@ -93,6 +94,96 @@ export function formatRole(role: string): string {
   return role.charAt(0).toUpperCase() + role.slice(1).toLowerCase();
 }
 
+/**
+ * Shared date formatters
+ * toLocale*String with options constructs a new Intl.DateTimeFormat on every
+ * call, which dominates when formatting long lists, so each format is built once
+ */
+const TIME_OF_DAY_FORMAT = new Intl.DateTimeFormat('en-US', { hour: 'numeric', minute: '2-digit', hour12: true });
+const WEEKDAY_FORMAT = new Intl.DateTimeFormat('en-US', { weekday: 'long' });
+const SHORT_DATE_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric', year: 'numeric' });
+const SHORT_DATE_NO_YEAR_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+
+/** Upper bound on memoized formatted strings per format */
+const MAX_MEMOIZED_TIMESTAMPS = 1000;
+
+const timeOfDayStrings = new LRUCache<number, string>({ max: MAX_MEMOIZED_TIMESTAMPS });
+const weekdayStrings = new LRUCache<number, string>({ max: MAX_MEMOIZED_TIMESTAMPS });
+const shortDateStrings = new LRUCache<number, string>({ max: MAX_MEMOIZED_TIMESTAMPS });
+
+/**
+ * Memo key for formats that show the time of day: the minute the date falls in
+ * None of the shared formats show seconds, so every timestamp in the same
+ * minute formats identically
+ * @param date - Date to key
+ * @returns Minutes since the epoch
+ */
+function minuteKey(date: Date): number {
+  return Math.floor(date.getTime() / 60000);
+}
+
+/**
+ * Memo key for date-only formats: the local calendar day the date falls in
+ * @param date - Date to key
+ * @returns Local year, month and day packed into one number
+ */
+function dayKey(date: Date): number {
+  return date.getFullYear() * 10000 + date.getMonth() * 100 + date.getDate();
+}
+
+/**
+ * Formats a date through a memo table, so lists re-rendered on each keystroke
+ * or refresh reuse the strings instead of formatting every row again
+ * @param memo - Memo table for this format
+ * @param format - Formatter to apply on a memo miss
+ * @param key - Memo key; dates with the same key must format identically
+ * @param date - Date to format
+ * @returns Formatted date string
+ */
+function formatMemoized(
+  memo: LRUCache<number, string>,
+  format: Intl.DateTimeFormat,
+  key: number,
+  date: Date
+): string {
+  let formatted = memo.get(key);
+  if (formatted === undefined) {
+    formatted = format.format(date);
+    memo.set(key, formatted);
+  }
+  return formatted;
+}
+
+/**
+ * Format the time of day, e.g. "3:45 PM"
+ * 
+ * @param date - Date to format
+ * @returns Formatted time string
+ */
+export function formatTimeOfDay(date: Date): string {
+  return formatMemoized(timeOfDayStrings, TIME_OF_DAY_FORMAT, minuteKey(date), date);
+}
+
+/**
+ * Format the day of the week, e.g. "Monday"
+ * 
+ * @param date - Date to format
+ * @returns Weekday name
+ */
+export function formatWeekday(date: Date): string {
+  return formatMemoized(weekdayStrings, WEEKDAY_FORMAT, dayKey(date), date);
+}
+
+/**
+ * Format a short calendar date, e.g. "Jan 15, 2024"
+ * 
+ * @param date - Date to format
+ * @returns Formatted date string
+ */
+export function formatShortDate(date: Date): string {
+  return formatMemoized(shortDateStrings, SHORT_DATE_FORMAT, dayKey(date), date);
+}
+
 /**
  * Format relative time from date string
  * Handles various time ranges with appropriate units
@@ -116,11 +207,9 @@ export function formatRelativeTime(dateString: string | Date): string {
   if (diffDays === 1) return '1 day ago';
   if (diffDays < 30) return `${diffDays} days ago`;
 
-  return date.toLocaleDateString('en-US', {
-    month: 'short',
-    day: 'numeric',
-    year: date.getFullYear() !== now.getFullYear() ? 'numeric' : undefined,
-  });
+  return date.getFullYear() !== now.getFullYear()
+    ? SHORT_DATE_FORMAT.format(date)
+    : SHORT_DATE_NO_YEAR_FORMAT.format(date);
 }
 
 /**